@@ -1,17 +1,104 @@
-from flask import Flask, render_template, jsonify, request, abort
+from flask import Flask, render_template, jsonify, request, abort, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from recommend import RecommenderFactory
+import hashlib
 import json
+from datetime import datetime
+import orjson
 from pathlib import Path
 import logging
 from config.logging_config import setup_logging
-import traceback
-from datetime import datetime
+from collections import defaultdict
+import numpy as np
+import faiss
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster response serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Cache expensive article/stats responses; the underlying data only changes
+# when the scraper runs, so a short TTL is safe
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+# Endpoints whose responses only depend on the scraped article data
+CACHED_API_PATHS = ('/api/articles', '/api/stats')
+
+def compute_data_etag(recommender):
+    """Compute an ETag from the article count and the latest scrape time"""
+    latest_scraped_at = ''
+    for metadata in recommender.article_meta:
+        scraped_at = metadata.get('scraped_at', '')
+        if scraped_at > latest_scraped_at:
+            latest_scraped_at = scraped_at
+    raw = f"{len(recommender.article_ids)}:{latest_scraped_at}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+def build_scraped_timestamps(recommender):
+    """Parse scraped_at strings once into a datetime64 array for /api/stats"""
+    timestamps = []
+    for metadata in recommender.article_meta:
+        scraped_at = metadata.get('scraped_at', '')
+        try:
+            # Stored format is '%Y-%m-%d %H:%M:%S'; datetime64 wants a 'T' separator
+            timestamps.append(np.datetime64(scraped_at.replace(' ', 'T')))
+        except ValueError:
+            timestamps.append(np.datetime64('NaT'))
+    return np.array(timestamps, dtype='datetime64[s]')
+
+def build_cluster_stats(recommender):
+    """Precompute the cluster array and representative topics for /api/stats"""
+    topics = defaultdict(list)
+    for cluster, metadata in zip(recommender.article_clusters, recommender.article_meta):
+        title = metadata.get('title')
+        # Keep the first 3 titles as representative topics
+        if title and len(topics[int(cluster)]) < 3:
+            topics[int(cluster)].append(title)
+
+    return recommender.article_clusters, dict(topics)
+
+def build_similarity_index(recommender):
+    """Build or load an int8-quantized FAISS index over the article vectors"""
+    article_ids = recommender.article_ids
+    # Copy so normalization doesn't mutate the recommender's own vectors
+    matrix = np.array(recommender.vector_array, dtype='float32', order='C')
+    # Normalize so inner product == cosine similarity
+    faiss.normalize_L2(matrix)
+
+    # Reuse the persisted index when it is still current
+    index_file = recommender.embed_file.with_suffix('.index')
+    if index_file.exists() and index_file.stat().st_mtime >= recommender.embed_file.stat().st_mtime:
+        index = faiss.read_index(str(index_file))
+        if index.ntotal == len(article_ids):
+            return index, article_ids, matrix
+
+    # 8-bit scalar quantization scans a quarter of the float32 footprint
+    # with negligible recall loss at this dimensionality
+    index = faiss.IndexScalarQuantizer(
+        matrix.shape[1],
+        faiss.ScalarQuantizer.QT_8bit,
+        faiss.METRIC_INNER_PRODUCT
+    )
+    index.train(matrix)
+    index.add(matrix)
+    faiss.write_index(index, str(index_file))
+
+    return index, article_ids, matrix
 
 # Initialize recommender
 try:
@@ -22,30 +109,57 @@ try:
         cluster_weight=0.2
     )
     logger.info("Recommender initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize recommender: {str(e)}")
-    logger.error(traceback.format_exc())
+except Exception:
+    logger.exception("Failed to initialize recommender")
     recommender = None
 
+# Build the similarity index once at startup; rebuild after scraping new articles
+similarity_index = None
+similarity_ids = []
+similarity_matrix = None
+id_to_row = {}
+data_etag = None
+scraped_timestamps = None
+article_clusters = None
+cluster_topics = {}
+if recommender:
+    try:
+        data_etag = compute_data_etag(recommender)
+        scraped_timestamps = build_scraped_timestamps(recommender)
+        article_clusters, cluster_topics = build_cluster_stats(recommender)
+        similarity_index, similarity_ids, similarity_matrix = build_similarity_index(recommender)
+        id_to_row = {aid: i for i, aid in enumerate(similarity_ids)}
+        logger.info(f"Built similarity index with {len(similarity_ids)} articles")
+    except Exception:
+        logger.exception("Failed to build similarity index")
+        similarity_index = None
+
 @app.before_request
 def before_request():
     """Validate request before processing"""
-    if request.is_json:
-        try:
-            request.get_json()
-        except Exception as e:
-            logger.error(f"Invalid JSON in request: {str(e)}")
+    # Only bodied methods carry JSON; silent=True avoids the raise/catch
+    # round-trip and the parsed body stays cached for the handler
+    if request.method in ('POST', 'PUT', 'PATCH') and request.is_json:
+        if request.get_json(silent=True, cache=True) is None:
+            logger.error("Invalid JSON in request")
             abort(400, description="Invalid JSON format")
-    
+
     # Log request details
     logger.info(f"Request: {request.method} {request.path} from {request.remote_addr}")
 
+    # Short-circuit cached endpoints when the client already has current data
+    if request.path in CACHED_API_PATHS and data_etag:
+        if request.headers.get('If-None-Match') == data_etag:
+            return '', 304
+
 @app.after_request
 def after_request(response):
     """Add security headers and handle CORS"""
     response.headers.add('Access-Control-Allow-Origin', '*')
     response.headers.add('Access-Control-Allow-Headers', 'Content-Type')
     response.headers.add('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+    if request.path in CACHED_API_PATHS and data_etag:
+        response.headers['ETag'] = data_etag
     return response
 
 @app.route('/')
@@ -55,35 +169,39 @@ def index():
 
 @app.route('/api/articles')
 def get_articles():
-    """Get all articles with their metadata"""
+    """Get all articles with their metadata, streamed one row at a time"""
     if not recommender:
         logger.error("Recommender not initialized")
         return jsonify({'error': 'Recommender not initialized'}), 500
-        
-    try:
-        articles = []
-        for article_id, data in recommender.article_vectors.items():
+
+    def generate():
+        # Frame the JSON array manually so the client starts receiving
+        # bytes immediately and the server never holds the full payload
+        yield b'['
+        first = True
+        for article_id, metadata in zip(recommender.article_ids, recommender.article_meta):
             # Skip articles without proper metadata
-            if not data.get('metadata') or not data['metadata'].get('title'):
+            if not metadata or not metadata.get('title'):
                 logger.warning(f"Skipping article {article_id} due to missing metadata")
                 continue
-                
-            articles.append({
+
+            if first:
+                first = False
+            else:
+                yield b','
+            yield orjson.dumps({
                 'article_id': article_id,
-                'title': data['metadata']['title'],
-                'content': data['metadata'].get('content', ''),
-                'metadata': data['metadata']
+                'title': metadata['title'],
+                'content': recommender.article_content(article_id),
+                'metadata': metadata
             })
-            
-        if not articles:
-            logger.warning("No valid articles found")
-            return jsonify([])
-            
-        logger.info(f"Returning {len(articles)} articles")
-        return jsonify(articles)
+        yield b']'
+
+    try:
+        logger.info(f"Streaming {len(recommender.article_ids)} articles")
+        return Response(stream_with_context(generate()), mimetype='application/json')
     except Exception as e:
-        logger.error(f"Error getting articles: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting articles")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/similar/<article_id>')
@@ -94,27 +212,48 @@ def get_similar_articles(article_id):
         return jsonify({'error': 'Recommender not initialized'}), 500
         
     try:
-        # Get recommendations for the article
-        similar_articles = recommender.recommend_for_user(
-            "demo_user",
-            recommender.article_vectors,
-            [article_id],  # Use the article as the user's reading history
-            top_n=5
-        )
-        
-        # Add content to the response
-        for article in similar_articles:
-            article_id = article['article_id']
-            if article_id in recommender.article_vectors:
-                article['content'] = recommender.article_vectors[article_id]['metadata'].get('content', '')
-        
+        if similarity_index is not None and article_id in id_to_row:
+            # Query the SQ8 index with the article's own vector (first hit is the
+            # article itself, so ask for one extra and drop it)
+            row = id_to_row[article_id]
+            distances, indices = similarity_index.search(similarity_matrix[row:row + 1], 6)
+
+            similar_articles = []
+            for score, idx in zip(distances[0], indices[0]):
+                if idx < 0:
+                    continue
+                similar_id = similarity_ids[idx]
+                if similar_id == article_id:
+                    continue
+                metadata = recommender.article_meta[idx]
+                similar_articles.append({
+                    'article_id': similar_id,
+                    'title': metadata.get('title', ''),
+                    'url': metadata.get('url', ''),
+                    'score': round(float(score), 4),
+                    'content': recommender.article_content(similar_id)
+                })
+            similar_articles = similar_articles[:5]
+        else:
+            # Fall back to the recommender when the index is unavailable
+            similar_articles = recommender.recommend_for_user(
+                "demo_user",
+                recommender.article_vectors,
+                [article_id],  # Use the article as the user's reading history
+                top_n=5
+            )
+
+            # Add content to the response
+            for article in similar_articles:
+                article['content'] = recommender.article_content(article['article_id'])
+
         return jsonify(similar_articles)
     except Exception as e:
-        logger.error(f"Error getting similar articles: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting similar articles")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/stats')
+@cache.cached(timeout=300)
 def get_stats():
     """Get statistics about articles including cluster distribution and freshness"""
     if not recommender:
@@ -122,66 +261,47 @@ def get_stats():
         return jsonify({'error': 'Recommender not initialized'}), 500
         
     try:
-        # Get cluster distribution
+        # Get cluster distribution from the precomputed cluster array
         cluster_counts = {}
-        for article_id, data in recommender.article_vectors.items():
-            cluster = data.get('cluster', -1)
-            cluster_counts[cluster] = cluster_counts.get(cluster, 0) + 1
-        
-        # Get freshness distribution
+        if article_clusters is not None and article_clusters.size:
+            offset = int(article_clusters.min())
+            counts = np.bincount(article_clusters - offset)
+            cluster_counts = {
+                int(cluster + offset): int(count)
+                for cluster, count in enumerate(counts) if count
+            }
+
+        # Get freshness distribution from the pre-parsed timestamp array
         freshness_counts = {
             'today': 0,
             'this_week': 0,
             'this_month': 0,
             'older': 0
         }
-        
-        for article_id, data in recommender.article_vectors.items():
-            try:
-                scraped_at = datetime.strptime(
-                    data['metadata']['scraped_at'],
-                    '%Y-%m-%d %H:%M:%S'
-                )
-                days_old = (datetime.now() - scraped_at).days
-                
-                if days_old == 0:
-                    freshness_counts['today'] += 1
-                elif days_old <= 7:
-                    freshness_counts['this_week'] += 1
-                elif days_old <= 30:
-                    freshness_counts['this_month'] += 1
-                else:
-                    freshness_counts['older'] += 1
-            except (KeyError, ValueError):
-                freshness_counts['older'] += 1
-        
-        # Get top topics for each cluster
-        cluster_topics = {}
-        for article_id, data in recommender.article_vectors.items():
-            cluster = data.get('cluster', -1)
-            if cluster not in cluster_topics:
-                cluster_topics[cluster] = []
-            
-            # Add article title to cluster topics
-            if 'metadata' in data and 'title' in data['metadata']:
-                cluster_topics[cluster].append(data['metadata']['title'])
-        
-        # Get most common words in each cluster's titles
-        for cluster in cluster_topics:
-            titles = cluster_topics[cluster]
-            if titles:
-                # Take first 3 titles as representative
-                cluster_topics[cluster] = titles[:3]
+
+        if scraped_timestamps is not None and scraped_timestamps.size:
+            valid = ~np.isnat(scraped_timestamps)
+            # datetime.now() is local time, matching the strftime-stamped
+            # scraped_at values; np.datetime64('now') would be UTC
+            days_old = (
+                (np.datetime64(datetime.now()) - scraped_timestamps[valid])
+                / np.timedelta64(1, 'D')
+            ).astype(int)
+            buckets = np.bincount(np.digitize(days_old, [1, 8, 31]), minlength=4)
+            freshness_counts['today'] = int(buckets[0])
+            freshness_counts['this_week'] = int(buckets[1])
+            freshness_counts['this_month'] = int(buckets[2])
+            # Unparseable timestamps count as older, matching the previous behavior
+            freshness_counts['older'] = int(buckets[3]) + int((~valid).sum())
         
         return jsonify({
-            'total_articles': len(recommender.article_vectors),
+            'total_articles': len(recommender.article_ids),
             'cluster_distribution': cluster_counts,
             'freshness_distribution': freshness_counts,
             'cluster_topics': cluster_topics
         })
     except Exception as e:
-        logger.error(f"Error getting stats: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error getting stats")
         return jsonify({'error': str(e)}), 500
 
 @app.errorhandler(400)
@@ -197,4 +317,6 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
+    # Development fallback only; Werkzeug's dev server handles one request
+    # at a time. Production runs under gunicorn via wsgi.py.
     app.run(host='0.0.0.0', port=5001, debug=True) 
\ No newline at end of file
@@ -2,14 +2,16 @@
 Embedder service for the BERT-MVP project.
 """
 import os
-import json
+import orjson
 import time
 from pathlib import Path
 from typing import Dict, List
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from app.utils.logger import setup_logger
-from config.default import EMBEDDINGS_DIR, EMBED_FILE
+from app.models.article import Article
+from config.default import EMBEDDINGS_DIR, EMBED_FILE, VECTORS_FILE
 
 logger = setup_logger(__name__)
 
@@ -29,50 +31,123 @@ class Embedder:
     def _load_cache(self) -> Dict[str, Dict]:
         """
         Load the embedding cache from disk.
-        
+
+        Vectors live in a memory-mapped float16 .npy matrix; the JSON file
+        only holds metadata plus each article's row index into the matrix.
+
         Returns:
             The embedding cache
         """
-        if EMBED_FILE.exists():
-            try:
-                with open(EMBED_FILE, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning("Cache file corrupted, starting fresh")
-        return {}
-    
+        if not EMBED_FILE.exists():
+            return {}
+
+        try:
+            cache = orjson.loads(EMBED_FILE.read_bytes())
+        except orjson.JSONDecodeError:
+            logger.warning("Cache file corrupted, starting fresh")
+            return {}
+
+        if VECTORS_FILE.exists():
+            vectors = np.load(VECTORS_FILE, mmap_mode="r")
+            for data in cache.values():
+                row = data.pop("row", None)
+                if row is not None and row < len(vectors):
+                    data["vector"] = vectors[row]
+
+        return cache
+
     def _save_cache(self, embeddings: Dict[str, Dict]):
         """
         Save the embedding cache to disk.
-        
+
+        Embedded vectors are stacked into one float16 matrix saved as .npy
+        (8x smaller than float64 JSON and loadable via mmap without parsing);
+        the metadata JSON stores each article's row index instead of the
+        vector itself.
+
         Args:
             embeddings: The embedding cache to save
         """
         try:
-            with open(EMBED_FILE, "w") as f:
-                json.dump(embeddings, f, indent=2)
+            vector_rows = []
+            meta = {}
+            for article_id, data in embeddings.items():
+                entry = {k: v for k, v in data.items() if k != "vector"}
+                vector = data.get("vector")
+                if vector is not None and len(vector) > 0:
+                    entry["row"] = len(vector_rows)
+                    vector_rows.append(np.asarray(vector, dtype=np.float16))
+                meta[article_id] = entry
+
+            if vector_rows:
+                np.save(VECTORS_FILE, np.stack(vector_rows))
+            EMBED_FILE.write_bytes(orjson.dumps(meta))
             logger.info(f"Successfully saved {len(embeddings)} embeddings to cache")
         except Exception as e:
             logger.error(f"Error saving cache: {str(e)}")
     
-    def _process_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def _process_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
         """
-        Process texts in batches for better performance.
-        
+        Encode all texts in one call for better performance.
+
+        Handing the full list to the model lets sentence-transformers drive
+        its own batching and tokenization pipeline instead of paying the
+        per-call overhead of a Python chunking loop.
+
         Args:
             texts: The texts to process
             batch_size: The batch size to use
-            
+
         Returns:
-            A list of embeddings
+            An array of embeddings, one row per text
         """
-        embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_embeddings = self.model.encode(batch, normalize_embeddings=True)
-            embeddings.extend(batch_embeddings.tolist())
-        return embeddings
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
     
+    def embed_new(self, articles: List[Article]) -> Dict[str, Dict]:
+        """
+        Embed freshly scraped articles in one batched pass.
+
+        Takes the scraper's articles directly so nothing has to be written
+        to the cache with an empty vector and re-read by a second run.
+
+        Args:
+            articles: New articles from the scraper
+
+        Returns:
+            The updated embedding cache
+        """
+        self.embedding_cache = self._load_cache()
+
+        new_articles = [
+            article for article in articles
+            if article.content and article.id not in self.embedding_cache
+        ]
+        if not new_articles:
+            return self.embedding_cache
+
+        logger.info(f"Embedding {len(new_articles)} new articles")
+        start_time = time.time()
+
+        embeddings = self._process_batch([article.content for article in new_articles])
+        for article, embedding in zip(new_articles, embeddings):
+            self.embedding_cache[article.id] = {
+                'vector': embedding.astype(np.float16),
+                'metadata': article.to_dict()
+            }
+
+        self._save_cache(self.embedding_cache)
+
+        duration = time.time() - start_time
+        logger.info(f"Processed {len(new_articles)} articles in {duration:.2f} seconds")
+
+        return self.embedding_cache
+
     def embed_articles(self, force_update: bool = False) -> Dict[str, Dict]:
         """
         Generate embeddings for all articles.
@@ -90,7 +165,8 @@ class Embedder:
         # Find new or updated articles
         new_articles = {}
         for article_id, data in self.embedding_cache.items():
-            if force_update or not data.get('vector'):
+            vector = data.get('vector')
+            if force_update or vector is None or len(vector) == 0:
                 new_articles[article_id] = {
                     'text': data['metadata']['content'],
                     'metadata': data['metadata']
@@ -105,10 +181,10 @@ class Embedder:
             texts = [article['text'] for article in new_articles.values()]
             embeddings = self._process_batch(texts)
             
-            # Update cache with metadata
+            # Update cache with metadata; store vectors as float16 directly
             for article_id, embedding, article_data in zip(article_ids, embeddings, new_articles.values()):
                 self.embedding_cache[article_id] = {
-                    'vector': embedding,
+                    'vector': embedding.astype(np.float16),
                     'metadata': article_data['metadata']
                 }
             
@@ -2,12 +2,13 @@
 Scraper service for the BERT-MVP project.
 """
 import requests
-from bs4 import BeautifulSoup
-import json
+import aiohttp
+import asyncio
+from selectolax.parser import HTMLParser
+import orjson
 import time
 import random
 import re
-import unicodedata
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -18,12 +19,30 @@ from config.default import (
     SCRAPER_DELAY_MIN,
     SCRAPER_DELAY_MAX,
     SCRAPER_MAX_ARTICLES,
+    SCRAPER_CONCURRENCY,
     ARTICLES_DIR,
-    EMBEDDINGS_DIR
+    EMBED_FILE
 )
 
 logger = setup_logger(__name__)
 
+# Compiled once at import; these run per paragraph in the scraping loop
+_WS_RE = re.compile(r'\s+')
+_KEEP_RE = re.compile(r'[^a-zA-ZěščřžýáíéúůďťňóĚŠČŘŽÝÁÍÉÚŮĎŤŇÓ\s.,!?0-9-]')
+_FN_INVALID_RE = re.compile(r'[^\w\s-]')
+_FN_SEP_RE = re.compile(r'[-\s]+')
+
+# Diacritics folding for the Czech character set: one C-level translate
+# call instead of NFKD normalization plus a per-character combining scan
+_CZ_LOWER = {
+    'á': 'a', 'č': 'c', 'ď': 'd', 'é': 'e', 'ě': 'e', 'í': 'i', 'ň': 'n',
+    'ó': 'o', 'ř': 'r', 'š': 's', 'ť': 't', 'ú': 'u', 'ů': 'u', 'ý': 'y', 'ž': 'z'
+}
+_CZ_TABLE = str.maketrans({
+    **_CZ_LOWER,
+    **{k.upper(): v.upper() for k, v in _CZ_LOWER.items()}
+})
+
 class Scraper:
     """Service for scraping articles from the web."""
     
@@ -81,9 +100,9 @@ class Scraper:
         if not text:
             return ""
         # Remove multiple spaces and newlines
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         # Keep alphanumeric, spaces, and basic punctuation
-        text = re.sub(r'[^a-zA-ZěščřžýáíéúůďťňóĚŠČŘŽÝÁÍÉÚŮĎŤŇÓ\s.,!?0-9-]', '', text)
+        text = _KEEP_RE.sub('', text)
         return text.strip()
     
     def _sanitize_filename(self, filename: str) -> str:
@@ -97,13 +116,13 @@ class Scraper:
             A safe filename
         """
         # Remove diacritics
-        filename = unicodedata.normalize('NFKD', filename)
-        filename = ''.join(c for c in filename if not unicodedata.combining(c))
-        
+        filename = filename.translate(_CZ_TABLE)
+
+
         # Replace spaces with underscores and remove invalid characters
-        filename = re.sub(r'[^\w\s-]', '', filename)
-        filename = re.sub(r'[-\s]+', '_', filename)
-        
+        filename = _FN_INVALID_RE.sub('', filename)
+        filename = _FN_SEP_RE.sub('_', filename)
+
         return filename.lower()[:50]
     
     def _get_article_links(self) -> List[str]:
@@ -128,11 +147,14 @@ class Scraper:
                 logger.error("Response is not HTML")
                 return []
             
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Find all article links
-            article_links = []
-            
+            tree = HTMLParser(response.text)
+
+            # Find all article links, deduplicated as they are collected
+            article_links = set()
+
+            # Skip links back to the section page itself
+            skip_suffix = self.base_url.rsplit('/', 1)[-1]
+
             # Try different selectors
             selectors = [
                 'article h2 a',  # Common pattern for article headlines
@@ -140,61 +162,87 @@ class Scraper:
                 '.article-list a',  # List of articles
                 '.content a'  # Generic content area
             ]
-            
+
             for selector in selectors:
-                links = soup.select(selector)
+                links = tree.css(selector)
                 for link in links:
-                    href = link.get('href', '')
-                    if href and not href.endswith(self.base_url.split('/')[-1]):
+                    href = link.attributes.get('href') or ''
+                    if href and not href.endswith(skip_suffix):
                         full_url = f"https://www.e15.cz{href}" if not href.startswith('http') else href
-                        article_links.append(full_url)
-            
+                        article_links.add(full_url)
+
             # Log the HTML if no links found
             if not article_links:
                 logger.debug(f"HTML content: {response.text[:1000]}")
                 logger.warning("No article links found")
-            
-            return list(set(article_links))  # Remove duplicates
+
+            return list(article_links)
             
         except Exception as e:
             logger.error(f"Error fetching article links: {str(e)}")
             return []
     
-    def _scrape_article(self, url: str) -> Optional[Article]:
+    async def _scrape_article(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Article]:
         """
         Scrape content from a single article.
-        
+
         Args:
             url: The URL of the article to scrape
-            
+            session: The shared aiohttp session
+            semaphore: Semaphore bounding concurrent fetches
+
         Returns:
             An Article instance or None if scraping failed
         """
         try:
-            # Add random delay
-            time.sleep(random.uniform(SCRAPER_DELAY_MIN, SCRAPER_DELAY_MAX))
-            
-            response = self.session.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            if 'text/html' not in response.headers.get('Content-Type', ''):
-                logger.error(f"Response for {url} is not HTML")
-                return None
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
+            async with semaphore:
+                # Add random delay; the semaphore keeps fetches polite
+                # while letting them overlap
+                await asyncio.sleep(random.uniform(SCRAPER_DELAY_MIN, SCRAPER_DELAY_MAX))
+
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    response.raise_for_status()
+
+                    if 'text/html' not in response.headers.get('Content-Type', ''):
+                        logger.error(f"Response for {url} is not HTML")
+                        return None
+
+                    html = await response.text()
+
+            # Parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(self._parse_article, url, html)
+
+        except Exception as e:
+            logger.error(f"Error scraping article {url}: {str(e)}")
+            return None
+
+    def _parse_article(self, url: str, html: str) -> Optional[Article]:
+        """
+        Parse a downloaded article page into an Article.
+
+        Args:
+            url: The URL the page was fetched from
+            html: The raw HTML of the page
+
+        Returns:
+            An Article instance or None if the page is missing content
+        """
+        try:
+            tree = HTMLParser(html)
+
             # Extract article content with multiple selector attempts
             title = None
             for selector in ['h1.article-title', 'h1.title', 'h1']:
-                title_elem = soup.select_one(selector)
+                title_elem = tree.css_first(selector)
                 if title_elem:
-                    title = title_elem.text.strip()
+                    title = title_elem.text(strip=True)
                     break
-            
+
             content = []
             # Try different content selectors
             content_selectors = [
@@ -202,12 +250,12 @@ class Scraper:
                 'div.content p',
                 'article p'
             ]
-            
+
             for selector in content_selectors:
-                paragraphs = soup.select(selector)
+                paragraphs = tree.css(selector)
                 if paragraphs:
                     for p in paragraphs:
-                        text = p.text.strip()
+                        text = p.text(strip=True)
                         if text and not text.startswith(('Foto:', 'Zdroj:', 'Související:', 'Autor:')):
                             content.append(text)
                     break
@@ -231,52 +279,57 @@ class Scraper:
             )
             
             return article
-            
+
         except Exception as e:
-            logger.error(f"Error scraping article {url}: {str(e)}")
+            logger.error(f"Error parsing article {url}: {str(e)}")
             return None
-    
-    def scrape_and_save(self, max_articles: int = SCRAPER_MAX_ARTICLES) -> int:
+
+    async def _scrape_articles(self, urls: List[str]) -> List[Article]:
         """
-        Scrape articles and save them to files.
-        
+        Scrape multiple articles concurrently.
+
+        Args:
+            urls: The article URLs to scrape
+
+        Returns:
+            The successfully scraped articles
+        """
+        semaphore = asyncio.Semaphore(SCRAPER_CONCURRENCY)
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            results = await asyncio.gather(
+                *[self._scrape_article(url, session, semaphore) for url in urls]
+            )
+        return [article for article in results if article]
+
+    def scrape_and_save(self, max_articles: int = SCRAPER_MAX_ARTICLES) -> List[Article]:
+        """
+        Scrape articles and return the newly found ones.
+
+        New articles are handed to the embedder in memory (see
+        Embedder.embed_new) instead of being round-tripped through the
+        embedding cache with empty vector placeholders.
+
         Args:
             max_articles: Maximum number of articles to scrape
-            
+
         Returns:
-            Number of articles scraped
+            The newly scraped articles
         """
         article_links = self._get_article_links()
         logger.info(f"Found {len(article_links)} articles")
-        
-        # Load existing articles
-        output_file = EMBEDDINGS_DIR / 'article_vectors.json'
-        existing_articles = {}
-        if output_file.exists():
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_articles = json.load(f)
-        
-        scraped_count = 0
-        for url in article_links[:max_articles]:
-            try:
-                article = self._scrape_article(url)
-                if article and article.content:  # Only save if we got content
-                    if article.id not in existing_articles:
-                        existing_articles[article.id] = {
-                            'metadata': article.to_dict(),
-                            'vector': []  # Vector will be added by the embedding script
-                        }
-                        scraped_count += 1
-                        logger.info(f"Saved article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(SCRAPER_DELAY_MIN, SCRAPER_DELAY_MAX))
-            except Exception as e:
-                logger.error(f"Error processing article {url}: {str(e)}")
-        
-        # Save all articles
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_articles, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"Successfully scraped and saved {scraped_count} new articles")
-        return scraped_count 
\ No newline at end of file
+
+        # Skip articles that are already in the embedding cache
+        existing_ids = set()
+        if EMBED_FILE.exists():
+            existing_ids = set(orjson.loads(EMBED_FILE.read_bytes()).keys())
+
+        new_articles = []
+        articles = asyncio.run(self._scrape_articles(article_links[:max_articles]))
+        for article in articles:
+            if article.content and article.id not in existing_ids:
+                new_articles.append(article)
+                existing_ids.add(article.id)
+                logger.info(f"Scraped article: {article.title}")
+
+        logger.info(f"Successfully scraped {len(new_articles)} new articles")
+        return new_articles 
\ No newline at end of file
@@ -15,6 +15,7 @@ PROFILES_DIR = DATA_DIR / "profiles"
 
 # File paths
 EMBED_FILE = EMBEDDINGS_DIR / "article_vectors.json"
+VECTORS_FILE = EMBEDDINGS_DIR / "article_vectors.npy"
 PROFILE_FILE = PROFILES_DIR / "user_profiles.json"
 RECOMMENDATIONS_FILE = DATA_DIR / "recommendations.json"
 
@@ -38,6 +39,7 @@ CACHE_SIZE = int(os.getenv("CACHE_SIZE", "128"))
 SCRAPER_DELAY_MIN = float(os.getenv("SCRAPER_DELAY_MIN", "2.0"))
 SCRAPER_DELAY_MAX = float(os.getenv("SCRAPER_DELAY_MAX", "4.0"))
 SCRAPER_MAX_ARTICLES = int(os.getenv("SCRAPER_MAX_ARTICLES", "10"))
+SCRAPER_CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "4"))
 
 # Available sections for scraping
 AVAILABLE_SECTIONS = {
@@ -1,22 +1,52 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+from config.default import LOG_LEVEL, LOG_FORMAT
+
+# Background listener that owns the real handlers; started once per process
+_listener = None
 
 def setup_logging():
+    global _listener
+
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
         os.makedirs('logs')
 
-    # Configure logging
+    if _listener is not None:
+        return logging.getLogger(__name__)
+
+    # Request threads only enqueue records; the listener thread does the
+    # actual (locking, synchronous) file and stream writes
+    log_queue = queue.Queue(-1)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = RotatingFileHandler('logs/app.log', maxBytes=10000000, backupCount=5)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    # The queue handler passes records through verbatim; only the
+    # listener's handlers apply LOG_FORMAT, otherwise prepare() would
+    # bake basicConfig's default format into the message first
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # force=True replaces any handlers installed by modules imported
+    # earlier, so the queue handler actually ends up on root
     logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            RotatingFileHandler('logs/app.log', maxBytes=10000000, backupCount=5),
-            logging.StreamHandler()
-        ]
+        level=getattr(logging, LOG_LEVEL),
+        handlers=[queue_handler],
+        force=True
     )
 
+    _listener = QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
     # Create logger
     logger = logging.getLogger(__name__)
-    return logger 
\ No newline at end of file
+    return logger
@@ -1,39 +1,50 @@
 import os
-import json
+import orjson
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from typing import Dict, List, Tuple
 import time
 import re
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import normalize
+import faiss
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# No basicConfig at import time; the entry point configures handlers
 logger = logging.getLogger(__name__)
 
+# Compiled once; _preprocess_text runs per article
+_WS = re.compile(r'\s+')
+_BAD = re.compile(r'[^\w\s.,!?-]')
+
 class ArticleEmbedder:
     def __init__(
         self,
         model_name: str = "paraphrase-multilingual-mpnet-base-v2",  # More powerful multilingual model
         cache_dir: str = "embeddings",
         max_length: int = 512,  # BERT's max sequence length
-        batch_size: int = 16    # Smaller batch size for larger model
+        batch_size: int = 16,   # Smaller batch size for larger model
+        device: str = None,     # e.g. "cuda" to encode on GPU
+        backend: str = "onnx"   # ONNX Runtime roughly halves encode time on CPU
     ):
-        self.model = SentenceTransformer(model_name)
+        try:
+            # Needs sentence-transformers[onnx]; optimum exports and caches
+            # the ONNX graph on first use
+            self.model = SentenceTransformer(model_name, backend=backend)
+        except Exception as e:
+            logger.warning(f"Falling back to default backend ({backend} unavailable): {e}")
+            self.model = SentenceTransformer(model_name)
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.embedding_cache = {}
         self.max_length = max_length
         self.batch_size = batch_size
+        self.device = device
         
     def _preprocess_text(self, text: str) -> str:
         """Clean and normalize text for better embedding quality"""
-        # Remove special characters and extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s.,!?-]', '', text)
+        # Remove special characters and extra whitespace in one pass each
+        text = _WS.sub(' ', _BAD.sub('', text))
         
         # Truncate to max length while preserving sentence boundaries
         if len(text) > self.max_length:
@@ -47,59 +58,96 @@ class ArticleEmbedder:
         return text.strip()
     
     def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached embeddings; vectors come from a memory-mapped float16 matrix"""
         cache_file = self.cache_dir / "article_vectors.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning("Cache file corrupted, starting fresh")
-        return {}
-    
+        if not cache_file.exists():
+            return {}
+
+        try:
+            cache = orjson.loads(cache_file.read_bytes())
+        except orjson.JSONDecodeError:
+            logger.warning("Cache file corrupted, starting fresh")
+            return {}
+
+        vectors_file = self.cache_dir / "article_vectors.npy"
+        if vectors_file.exists():
+            vectors = np.load(vectors_file, mmap_mode="r")
+            for data in cache.values():
+                row = data.pop("row", None)
+                if row is not None and row < len(vectors):
+                    data["vector"] = vectors[row]
+
+        return cache
+
     def _save_cache(self, embeddings: Dict[str, Dict]):
+        """Save embeddings as a float16 .npy matrix plus a metadata JSON sidecar
+
+        The matrix is ~8x smaller than JSON-encoded float lists and loads via
+        mmap without any parsing; the JSON keeps metadata/cluster plus each
+        article's row index into the matrix.
+        """
         cache_file = self.cache_dir / "article_vectors.json"
+        vectors_file = self.cache_dir / "article_vectors.npy"
         try:
-            with open(cache_file, "w") as f:
-                json.dump(embeddings, f, indent=2)
+            vector_rows = []
+            meta = {}
+            for article_id, data in embeddings.items():
+                entry = {k: v for k, v in data.items() if k != "vector"}
+                vector = data.get("vector")
+                if vector is not None and len(vector) > 0:
+                    entry["row"] = len(vector_rows)
+                    vector_rows.append(np.asarray(vector, dtype=np.float16))
+                meta[article_id] = entry
+
+            if vector_rows:
+                np.save(vectors_file, np.stack(vector_rows))
+            cache_file.write_bytes(orjson.dumps(meta))
             logger.info(f"Successfully saved {len(embeddings)} embeddings to cache")
         except Exception as e:
             logger.error(f"Error saving cache: {str(e)}")
     
-    def _process_batch(self, texts: List[str]) -> List[List[float]]:
-        """Process texts in batches for better performance"""
-        # Preprocess texts
+    def _process_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode all texts in one call so SBERT can length-sort the batches
+
+        A single encode() lets sentence-transformers bucket texts by length
+        and pad only to each bucket's max, instead of restarting tokenizer
+        and model overhead per manual chunk.
+        """
         processed_texts = [self._preprocess_text(text) for text in texts]
-        
-        # Generate embeddings
-        embeddings = []
-        for i in range(0, len(processed_texts), self.batch_size):
-            batch = processed_texts[i:i + self.batch_size]
-            batch_embeddings = self.model.encode(
-                batch,
-                normalize_embeddings=True,
-                show_progress_bar=True
-            )
-            embeddings.extend(batch_embeddings.tolist())
-        
-        return embeddings
+
+        return self.model.encode(
+            processed_texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=True,
+            device=self.device
+        ).astype(np.float16)
     
-    def _cluster_embeddings(self, embeddings: List[List[float]], n_clusters: int = 5) -> List[int]:
-        """Cluster similar articles together"""
-        # Normalize embeddings
-        normalized_embeddings = normalize(np.array(embeddings))
-        
-        # Perform clustering
-        kmeans = KMeans(n_clusters=min(n_clusters, len(embeddings)), random_state=42)
-        clusters = kmeans.fit_predict(normalized_embeddings)
-        
-        return clusters.tolist()
+    def _cluster_embeddings(self, embeddings: np.ndarray, n_clusters: int = 5) -> List[int]:
+        """Cluster similar articles with FAISS spherical k-means
+
+        The encoder already L2-normalizes its output, so spherical k-means
+        optimizes the cosine objective directly; FAISS runs the distance
+        computations through SIMD/BLAS kernels.
+        """
+        X = np.ascontiguousarray(embeddings, dtype=np.float32)
+        kmeans = faiss.Kmeans(
+            X.shape[1],
+            min(n_clusters, len(X)),
+            niter=20,
+            spherical=True,
+            seed=42
+        )
+        kmeans.train(X)
+        _, labels = kmeans.index.search(X, 1)
+
+        return labels.ravel().tolist()
     
     def _load_article(self, filepath: Path) -> Dict:
         """Load and parse article from JSON file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                article = json.load(f)
-            return article
+            return orjson.loads(filepath.read_bytes())
         except Exception as e:
             logger.error(f"Error reading {filepath}: {str(e)}")
             return None
@@ -115,17 +163,25 @@ class ArticleEmbedder:
             self.embedding_cache = self._load_cache()
         
         # Find new or updated articles
+        candidates = [
+            filepath for filepath in article_dir.glob("*.txt")
+            if force_update or filepath.stem not in self.embedding_cache
+        ]
+
+        # orjson releases the GIL during parsing, so threads overlap the
+        # file reads and the parses
         new_articles = {}
-        for filepath in article_dir.glob("*.txt"):
-            article_id = filepath.stem
-            if force_update or article_id not in self.embedding_cache:
-                article = self._load_article(filepath)
+        with ThreadPoolExecutor() as executor:
+            for filepath, article in zip(
+                candidates, executor.map(self._load_article, candidates)
+            ):
                 if article and article.get('content'):
-                    new_articles[article_id] = {
+                    # Content is embedded but not cached; consumers lazy-load
+                    # it from the source file to keep the cache small
+                    new_articles[filepath.stem] = {
                         'text': article['content'],
                         'metadata': {
                             'title': article.get('title', ''),
-                            'content': article.get('content', ''),
                             'url': article.get('url', ''),
                             'scraped_at': article.get('scraped_at', '')
                         }
@@ -172,4 +228,5 @@ def main():
         raise
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import json
+import orjson
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from joblib import Parallel, delayed
 from typing import Dict, List, Tuple, Optional, Union
 import logging
 from datetime import datetime
@@ -9,10 +10,86 @@ import time
 from functools import lru_cache
 from abc import ABC, abstractmethod
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Handler setup belongs to the entry point (setup_logging or the
+# __main__ guard); configuring here would pre-empt the queue handler
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Below this many articles a brute-force matvec beats graph traversal,
+# so the HNSW index is only built for larger collections
+_ANN_MIN_ARTICLES = 1024
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mmr_kernel(relevance, normalized, top_n, lambda_param):
+        """JIT-compiled MMR selection over contiguous float32 arrays
+
+        Fuses the argmax scan and the max-similarity update into one tight
+        loop per pick, avoiding the NumPy temporaries of the fallback path.
+        """
+        m, d = normalized.shape
+        k = min(top_n, m)
+        selected = np.empty(k, dtype=np.int64)
+        taken = np.zeros(m, dtype=np.bool_)
+        max_sim = np.full(m, -np.inf, dtype=np.float32)
+
+        for step in range(k):
+            pick = -1
+            best = -np.inf
+            for i in range(m):
+                if taken[i]:
+                    continue
+                if step == 0:
+                    score = relevance[i]
+                else:
+                    score = (
+                        lambda_param * relevance[i]
+                        - (1.0 - lambda_param) * max_sim[i]
+                    )
+                if score > best:
+                    best = score
+                    pick = i
+            selected[step] = pick
+            taken[pick] = True
+            for i in range(m):
+                s = np.float32(0.0)
+                for j in range(d):
+                    s += normalized[pick, j] * normalized[i, j]
+                if s > max_sim[i]:
+                    max_sim[i] = s
+
+        return selected
+else:
+    _mmr_kernel = None
+
+def _top_k_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n highest scores, sorted descending
+
+    argpartition is O(M) versus a full O(M log M) sort; only the selected
+    entries get sorted. -inf scores (masked read articles) are dropped.
+    """
+    k = min(top_n, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    return idx[np.isfinite(scores[idx])]
+
+
 class BaseRecommender(ABC):
     """Base class for article recommenders"""
     
@@ -21,15 +98,20 @@ class BaseRecommender(ABC):
         embed_file: str = "embeddings/article_vectors.json",
         profile_file: str = "profiles/user_profiles.json",
         output_file: str = "recommendations.json",
+        article_dir: str = "articles",
         cache_size: int = 128
     ):
         self.embed_file = Path(embed_file)
         self.profile_file = Path(profile_file)
         self.output_file = Path(output_file)
-        
-        # Initialize caches
+        self.article_dir = Path(article_dir)
+        self.cache_size = cache_size
+
         self._load_data()
-        self._initialize_caches(cache_size)
+
+        # Per-instance memo of profile vectors; read lists rarely change
+        # between calls, so repeated users skip the gather and mean
+        self._profile_vec = lru_cache(maxsize=cache_size)(self._profile_vec)
     
     def _load_data(self):
         """Load embeddings and user profiles"""
@@ -38,54 +120,183 @@ class BaseRecommender(ABC):
                 self.article_vectors = json.load(f)
             with open(self.profile_file) as f:
                 self.user_profiles = json.load(f)
-            
+
+            # Attach memory-mapped rows when the float16 vector matrix
+            # exists; legacy caches still carry their vectors inline
+            vectors_file = self.embed_file.with_suffix('.npy')
+            mmap_vectors = None
+            if vectors_file.exists():
+                mmap_vectors = np.load(vectors_file, mmap_mode='r')
+                for data in self.article_vectors.values():
+                    row = data.pop('row', None)
+                    if row is not None and row < len(mmap_vectors):
+                        data['vector'] = mmap_vectors[row]
+
             # Filter out articles with no vectors or zero-length vectors
             valid_articles = {}
             for aid, data in self.article_vectors.items():
-                if 'vector' in data and isinstance(data['vector'], list) and len(data['vector']) > 0:
+                vector = data.get('vector')
+                if vector is not None and len(vector) > 0:
                     valid_articles[aid] = data
-            
+
             self.article_vectors = valid_articles
             self.article_ids = list(self.article_vectors.keys())
-            
+
             if not self.article_ids:
                 logger.error("No valid articles found with vectors")
                 raise ValueError("No valid articles found with vectors")
-            
+
             # Get the expected vector length from the first valid article
             expected_length = len(self.article_vectors[self.article_ids[0]]['vector'])
             logger.info(f"Expected vector length: {expected_length}")
-            
-            # Create a list of vectors, ensuring they're all the same length
-            vectors = []
-            for aid in self.article_ids:
-                vector = self.article_vectors[aid]['vector']
-                if len(vector) != expected_length:
-                    logger.warning(f"Vector length mismatch for article {aid}: {len(vector)} vs {expected_length}")
-                    # Pad or truncate to match expected length
-                    if len(vector) < expected_length:
-                        vector = vector + [0] * (expected_length - len(vector))
-                    else:
-                        vector = vector[:expected_length]
-                vectors.append(vector)
-            
-            # Convert to numpy array
-            self.vector_array = np.array(vectors, dtype=np.float32)
-            
+
+            if mmap_vectors is not None and len(self.article_ids) == len(mmap_vectors):
+                # All vectors live in the matrix; use the mmap directly and
+                # only upcast slices to float32 in the similarity kernels
+                self.vector_array = mmap_vectors
+            else:
+                # Stack row by row, padding or truncating to the expected length
+                vectors = np.zeros((len(self.article_ids), expected_length), dtype=np.float32)
+                for i, aid in enumerate(self.article_ids):
+                    vector = np.asarray(self.article_vectors[aid]['vector'], dtype=np.float32)
+                    if len(vector) != expected_length:
+                        logger.warning(f"Vector length mismatch for article {aid}: {len(vector)} vs {expected_length}")
+                    length = min(len(vector), expected_length)
+                    vectors[i, :length] = vector[:length]
+                self.vector_array = vectors
+
+            # L2-normalize once so cosine similarity against the whole
+            # collection is a single BLAS matmul with no per-call norms
+            dense = np.asarray(self.vector_array, dtype=np.float32)
+            norms = np.linalg.norm(dense, axis=1, keepdims=True).clip(min=1e-12)
+            self.vector_array_n = dense / norms
+
+            # int8 copy for SimSIMD's VNNI cosine kernel; cosine is
+            # scale-invariant, so per-row scaling only affects precision
+            if simsimd is not None:
+                scales = np.abs(self.vector_array_n).max(axis=1).clip(min=1e-12)
+                self.vector_array_i8 = np.round(
+                    self.vector_array_n / scales[:, None] * 127
+                ).astype(np.int8)
+
+            # Structure-of-arrays views: similarity scans touch only the
+            # contiguous vector_array; metadata and clusters are parallel
+            # sequences indexed by row number
+            self.article_meta = [
+                self.article_vectors[aid].get('metadata', {}) for aid in self.article_ids
+            ]
+            self.article_clusters = np.array(
+                [self.article_vectors[aid].get('cluster', -1) for aid in self.article_ids],
+                dtype=np.int32
+            )
+            self.id_to_idx = {aid: i for i, aid in enumerate(self.article_ids)}
+            self.n_clusters = int(self.article_clusters.max()) + 1
+
+            # HNSW graph over the normalized vectors for sublinear top-k
+            # retrieval; stays None (brute-force scoring) when faiss is
+            # unavailable or the collection is small
+            self.ann_index = None
+            if faiss is not None and len(self.article_ids) >= _ANN_MIN_ARTICLES:
+                index = faiss.IndexHNSWFlat(
+                    self.vector_array_n.shape[1], 32, faiss.METRIC_INNER_PRODUCT
+                )
+                index.hnsw.efConstruction = 80
+                index.add(np.ascontiguousarray(self.vector_array_n))
+                self.ann_index = index
+
+            # Parse scraped_at once at load time; time decay is then a
+            # single vectorized exp instead of a strptime per candidate
+            timestamps = []
+            for metadata in self.article_meta:
+                scraped_at = metadata.get('scraped_at', '')
+                try:
+                    # Stored as '%Y-%m-%d %H:%M:%S'; datetime64 wants a 'T'
+                    timestamps.append(np.datetime64(scraped_at.replace(' ', 'T')))
+                except ValueError:
+                    timestamps.append(np.datetime64('NaT'))
+            self.scraped_ts = np.array(timestamps, dtype='datetime64[s]')
+
             logger.info(f"Loaded {len(self.article_vectors)} valid article vectors")
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             raise
     
-    def _initialize_caches(self, cache_size: int):
-        """Initialize LRU caches for expensive operations"""
-        self._get_article_vector = lru_cache(maxsize=cache_size)(self._get_article_vector)
-    
     def _get_article_vector(self, article_id: str) -> np.ndarray:
-        """Get article vector with caching"""
-        return np.array(self.article_vectors[article_id]['vector'])
+        """Get an article's vector as a view into the matrix"""
+        return self.vector_array[self.id_to_idx[article_id]]
     
+    def article_content(self, article_id: str) -> str:
+        """Load an article's content lazily from its source file
+
+        The embedding cache no longer duplicates article bodies, so only
+        the handful of articles actually returned ever touch disk. Legacy
+        caches that still embed content are served from metadata directly.
+        """
+        metadata_content = self.article_vectors.get(article_id, {}).get(
+            'metadata', {}
+        ).get('content')
+        if metadata_content:
+            return metadata_content
+        try:
+            article = json.loads(
+                (self.article_dir / f"{article_id}.txt").read_text(encoding='utf-8')
+            )
+            return article.get('content', '')
+        except (OSError, json.JSONDecodeError):
+            return ''
+
+    def _profile_vec(self, reads_key: Tuple[int, ...]) -> Optional[np.ndarray]:
+        """Normalized profile vector for a frozen tuple of read rows
+
+        Keyed on the sorted row tuple so permutations of the same read
+        list share one cache entry; the result is marked read-only since
+        cached arrays are shared across callers.
+        """
+        read_idx = np.asarray(reads_key, dtype=np.intp)
+        profile = self.vector_array_n[read_idx].mean(axis=0)
+        norm = np.linalg.norm(profile)
+        if norm == 0:
+            return None
+        profile = profile / norm
+        profile.setflags(write=False)
+        return profile
+
+    def _read_indices(self, user_reads: List[str]) -> np.ndarray:
+        """Map read article ids to a row-index array, dropping unknown ids"""
+        return np.fromiter(
+            (self.id_to_idx[aid] for aid in user_reads if aid in self.id_to_idx),
+            dtype=np.intp
+        )
+
+    def _profile_matrix(self, read_indices: List[np.ndarray]) -> np.ndarray:
+        """Build the L2-normalized user-profile matrix (users x dims)
+
+        Each row is the mean of that user's normalized read vectors;
+        users with no known reads stay all-zero.
+        """
+        profiles = np.zeros(
+            (len(read_indices), self.vector_array_n.shape[1]), dtype=np.float32
+        )
+        for u, read_idx in enumerate(read_indices):
+            if read_idx.size:
+                profiles[u] = self.vector_array_n[read_idx].mean(axis=0)
+        norms = np.linalg.norm(profiles, axis=1, keepdims=True).clip(min=1e-12)
+        return profiles / norms
+
     @abstractmethod
+    def _recommend_from_scores(
+        self,
+        read_idx: np.ndarray,
+        scores: np.ndarray,
+        top_n: int
+    ) -> List[Dict[str, float]]:
+        """Turn a row of per-article semantic scores into recommendations
+
+        `scores` is aligned with article_ids; read articles are already
+        masked to -inf.
+        """
+        pass
+
     def recommend_for_user(
         self,
         user_id: str,
@@ -94,28 +305,89 @@ class BaseRecommender(ABC):
         top_n: int = 5
     ) -> List[Dict[str, float]]:
         """Generate recommendations for a user"""
-        pass
-    
+        if not user_reads:
+            return []
+
+        read_idx = self._read_indices(user_reads)
+        if read_idx.size == 0:
+            return []
+
+        profile = self._profile_vec(tuple(sorted(read_idx.tolist())))
+        if profile is None:
+            return []
+        if self.ann_index is not None:
+            # ANN shortlist: everything outside the retrieved set stays
+            # masked, so subclasses rerank only the shortlist
+            k = min(top_n + len(read_idx), len(self.article_ids))
+            distances, indices = self.ann_index.search(
+                np.ascontiguousarray(profile[None, :], dtype=np.float32), k
+            )
+            scores = np.full(len(self.article_ids), -np.inf, dtype=np.float32)
+            hits = indices[0] >= 0
+            scores[indices[0][hits]] = distances[0][hits]
+        else:
+            scores = self._score_profile(profile)
+        scores[read_idx] = -np.inf
+
+        return self._recommend_from_scores(read_idx, scores, top_n)
+
+    def _score_profile(self, profile: np.ndarray) -> np.ndarray:
+        """Cosine scores of one normalized profile against every article
+
+        Runs SimSIMD's int8 kernel when available (4x smaller operands,
+        VNNI dot products); otherwise one matvec against the float32
+        pre-normalized matrix.
+        """
+        if simsimd is not None:
+            scale = max(np.abs(profile).max(), 1e-12)
+            profile_i8 = np.round(profile / scale * 127).astype(np.int8)
+            distances = simsimd.cdist(
+                profile_i8[None, :], self.vector_array_i8, "cosine"
+            )
+            return 1.0 - np.asarray(distances, dtype=np.float32)[0]
+        return self.vector_array_n @ profile
+
     def generate_all_recommendations(self, top_n: int = 5):
         """Generate recommendations for all users"""
         all_recommendations = {}
         start_time = time.time()
-        
-        for user_id, read_articles in self.user_profiles.items():
+
+        user_ids = list(self.user_profiles.keys())
+        read_indices = [
+            self._read_indices(self.user_profiles[uid]) for uid in user_ids
+        ]
+
+        # Score every user against every article in a single sgemm instead
+        # of one matvec per user; only the top-N rows per user become dicts
+        score_matrix = self._profile_matrix(read_indices) @ self.vector_array_n.T
+
+        def build_user_recs(user_id, read_idx, scores):
             try:
-                recs = self.recommend_for_user(
-                    user_id,
-                    self.article_vectors,
-                    read_articles,
-                    top_n=top_n
-                )
-                all_recommendations[user_id] = recs
+                if read_idx.size == 0:
+                    return []
+                scores[read_idx] = -np.inf
+                return self._recommend_from_scores(read_idx, scores, top_n)
             except Exception as e:
                 logger.error(f"Error generating recommendations for user {user_id}: {str(e)}")
-        
-        # Save recommendations
-        with open(self.output_file, "w") as f:
-            json.dump(all_recommendations, f, indent=2)
+                return None
+
+        # The per-user tail is embarrassingly parallel; threads suffice
+        # because the hot path is released-GIL NumPy
+        results = Parallel(n_jobs=-1, prefer="threads", batch_size=32)(
+            delayed(build_user_recs)(user_id, read_idx, scores)
+            for user_id, read_idx, scores in zip(user_ids, read_indices, score_matrix)
+        )
+        all_recommendations = {
+            user_id: recs for user_id, recs in zip(user_ids, results)
+            if recs is not None
+        }
+
+        # Save recommendations; OPT_SERIALIZE_NUMPY writes the pre-rounded
+        # NumPy score scalars without boxing them into Python floats
+        self.output_file.write_bytes(orjson.dumps(
+            all_recommendations,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        ))
         
         duration = time.time() - start_time
         logger.info(f"Generated recommendations for {len(all_recommendations)} users in {duration:.2f} seconds")
@@ -124,61 +396,28 @@ class BaseRecommender(ABC):
 
 class SimpleRecommender(BaseRecommender):
     """Simple recommender based on cosine similarity"""
-    
-    def recommend_for_user(
+
+    def _recommend_from_scores(
         self,
-        user_id: str,
-        article_vectors: Dict[str, Dict],
-        user_reads: List[str],
-        top_n: int = 5
+        read_idx: np.ndarray,
+        scores: np.ndarray,
+        top_n: int
     ) -> List[Dict[str, float]]:
-        """Generate recommendations for a user using simple cosine similarity"""
-        if not user_reads:
-            return []
-        
-        # Compute user's profile vector from articles they've read
-        user_vecs = []
-        for aid in user_reads:
-            if aid in article_vectors:
-                vector = self._get_article_vector(aid)
-                if vector is not None:
-                    user_vecs.append(vector)
-        
-        if not user_vecs:
-            return []
-        
-        user_profile_vector = np.mean(user_vecs, axis=0)
-        
-        # Get candidate articles
-        candidate_ids = []
-        candidate_vectors = []
-        for aid in self.article_ids:
-            if aid not in user_reads:
-                candidate_ids.append(aid)
-                candidate_vectors.append(self._get_article_vector(aid))
-        
-        if not candidate_ids:
-            return []
-        
-        candidate_vectors = np.array(candidate_vectors)
-        
-        # Calculate similarities
-        similarities = cosine_similarity([user_profile_vector], candidate_vectors)[0]
-        
-        # Build recommendations
+        """Rank by semantic score alone; dicts are built for the winners only"""
+        top_idx = _top_k_indices(scores, top_n)
+        rounded = np.round(scores[top_idx], 4)
+
         recommendations = []
-        for i, (aid, score) in enumerate(zip(candidate_ids, similarities)):
-            article_data = article_vectors[aid]
+        for n, i in enumerate(top_idx):
+            metadata = self.article_meta[i]
             recommendations.append({
-                'article_id': aid,
-                'title': article_data['metadata'].get('title', ''),
-                'url': article_data['metadata'].get('url', ''),
-                'score': round(score, 4)
+                'article_id': self.article_ids[i],
+                'title': metadata.get('title', ''),
+                'url': metadata.get('url', ''),
+                'score': rounded[n]
             })
-        
-        # Sort by score and return top N
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:top_n]
+
+        return recommendations
 
 
 class AdvancedRecommender(BaseRecommender):
@@ -192,32 +431,45 @@ class AdvancedRecommender(BaseRecommender):
         diversity_weight: float = 0.3,
         time_decay_days: int = 30,
         cluster_weight: float = 0.2,
+        article_dir: str = "articles",
         cache_size: int = 128
     ):
-        super().__init__(embed_file, profile_file, output_file, cache_size)
+        super().__init__(
+            embed_file, profile_file, output_file,
+            article_dir=article_dir, cache_size=cache_size
+        )
         self.diversity_weight = diversity_weight
         self.time_decay_days = time_decay_days
         self.cluster_weight = cluster_weight
     
-    def _calculate_time_decay(self, article_id: str) -> float:
-        """Calculate time decay factor for an article"""
-        try:
-            scraped_at = datetime.strptime(
-                self.article_vectors[article_id]['metadata']['scraped_at'],
-                '%Y-%m-%d %H:%M:%S'
-            )
-            days_old = (datetime.now() - scraped_at).days
-            return np.exp(-days_old / self.time_decay_days)
-        except (KeyError, ValueError):
-            return 1.0
-    
-    def _calculate_cluster_similarity(self, user_clusters: List[int], article_cluster: int) -> float:
-        """Calculate similarity based on article clusters"""
-        if not user_clusters:
-            return 0.0
-        # Count how many times the article's cluster appears in user's history
-        cluster_count = user_clusters.count(article_cluster)
-        return cluster_count / len(user_clusters)
+    def _calculate_time_decay(self) -> np.ndarray:
+        """Calculate time decay factors for all articles at once"""
+        # datetime.now() is local time, like the strftime-stamped
+        # scraped_at values; np.datetime64('now') would be UTC
+        age_days = (
+            (np.datetime64(datetime.now()) - self.scraped_ts) / np.timedelta64(1, 'D')
+        ).astype(np.float32)
+        decays = np.exp(-age_days / self.time_decay_days)
+        # Articles with unparseable timestamps keep the neutral factor
+        return np.where(np.isnat(self.scraped_ts), np.float32(1.0), decays)
+
+    def _calculate_cluster_similarity(self, user_clusters: List[int]) -> np.ndarray:
+        """Calculate cluster affinity for all articles via a histogram gather"""
+        if not user_clusters or self.n_clusters <= 0:
+            return np.zeros(len(self.article_ids), dtype=np.float32)
+
+        # Share of the user's history in each cluster, built once; the
+        # per-article score is then a single array gather
+        user_hist = np.bincount(
+            np.asarray(user_clusters), minlength=self.n_clusters
+        ).astype(np.float32)
+        user_hist /= len(user_clusters)
+
+        return np.where(
+            self.article_clusters >= 0,
+            user_hist[np.clip(self.article_clusters, 0, self.n_clusters - 1)],
+            np.float32(0.0)
+        )
     
     def _maximal_marginal_relevance(
         self,
@@ -228,125 +480,89 @@ class AdvancedRecommender(BaseRecommender):
         top_n: int = 5
     ) -> List[Tuple[str, float]]:
         """Select diverse recommendations using MMR"""
-        selected = []
-        remaining = list(range(len(candidate_ids)))
-        
+        if len(candidate_ids) == 0:
+            return []
+
+        # Normalize once; every similarity below is then a plain dot product
+        candidate_vectors = np.asarray(candidate_vectors, dtype=np.float32)
+        norms = np.linalg.norm(candidate_vectors, axis=1, keepdims=True).clip(min=1e-12)
+        normalized = candidate_vectors / norms
+        query_norm = query_vector / max(np.linalg.norm(query_vector), 1e-12)
+        relevance = normalized @ query_norm
+
+        if _mmr_kernel is not None:
+            selected = _mmr_kernel(
+                np.ascontiguousarray(relevance, dtype=np.float32),
+                np.ascontiguousarray(normalized, dtype=np.float32),
+                top_n,
+                lambda_param
+            )
+            return [(candidate_ids[i], float(relevance[i])) for i in selected]
+
+        # NumPy fallback when numba is unavailable.
         # Get the most similar item first
-        similarities = cosine_similarity([query_vector], candidate_vectors)[0]
-        selected_idx = np.argmax(similarities)
-        selected.append(selected_idx)
-        remaining.remove(selected_idx)
-        
-        # Select remaining items using MMR
-        while len(selected) < top_n and remaining:
-            # Calculate relevance and diversity scores
-            relevance = cosine_similarity([query_vector], candidate_vectors[remaining])[0]
-            diversity = np.zeros(len(remaining))
-            
-            for i, idx in enumerate(remaining):
-                diversity[i] = np.mean([
-                    cosine_similarity([candidate_vectors[idx]], [candidate_vectors[j]])[0][0]
-                    for j in selected
-                ])
-            
-            # Combine scores
-            mmr_scores = lambda_param * relevance - (1 - lambda_param) * diversity
-            selected_idx = remaining[np.argmax(mmr_scores)]
+        selected = [int(np.argmax(relevance))]
+
+        # Running max similarity to any selected item; one matvec per pick
+        # replaces the nested per-pair cosine_similarity loop
+        max_sim_to_selected = normalized @ normalized[selected[0]]
+
+        while len(selected) < min(top_n, len(candidate_ids)):
+            mmr_scores = lambda_param * relevance - (1 - lambda_param) * max_sim_to_selected
+            mmr_scores[selected] = -np.inf
+            selected_idx = int(np.argmax(mmr_scores))
             selected.append(selected_idx)
-            remaining.remove(selected_idx)
-        
-        return [(candidate_ids[i], similarities[i]) for i in selected]
+            max_sim_to_selected = np.maximum(
+                max_sim_to_selected, normalized @ normalized[selected_idx]
+            )
+
+        return [(candidate_ids[i], float(relevance[i])) for i in selected]
     
-    def recommend_for_user(
+    def _recommend_from_scores(
         self,
-        user_id: str,
-        article_vectors: Dict[str, Dict],
-        user_reads: List[str],
-        top_n: int = 5
+        read_idx: np.ndarray,
+        scores: np.ndarray,
+        top_n: int
     ) -> List[Dict[str, float]]:
-        """Generate recommendations for a user using advanced features"""
-        if not user_reads:
-            return []
-        
-        # Compute user's profile vector and cluster history
-        user_vecs = []
-        user_clusters = []
-        for aid in user_reads:
-            if aid in article_vectors:
-                vector = self._get_article_vector(aid)
-                if vector is not None:
-                    user_vecs.append(vector)
-                    if 'cluster' in article_vectors[aid]:
-                        user_clusters.append(article_vectors[aid]['cluster'])
-        
-        if not user_vecs:
-            return []
-        
-        user_profile_vector = np.mean(user_vecs, axis=0)
-        
-        # Get candidate articles
-        candidate_ids = []
-        candidate_vectors = []
-        candidate_clusters = []
-        for aid in self.article_ids:
-            if aid not in user_reads:
-                candidate_ids.append(aid)
-                candidate_vectors.append(self._get_article_vector(aid))
-                if 'cluster' in article_vectors[aid]:
-                    candidate_clusters.append(article_vectors[aid]['cluster'])
-                else:
-                    candidate_clusters.append(-1)
-        
-        if not candidate_ids:
-            return []
-        
-        candidate_vectors = np.array(candidate_vectors)
-        
-        # Calculate base semantic similarity
-        semantic_similarities = cosine_similarity([user_profile_vector], candidate_vectors)[0]
-        
-        # Calculate time decay and cluster similarity
-        time_decays = []
-        cluster_similarities = []
-        for i, (aid, cluster) in enumerate(zip(candidate_ids, candidate_clusters)):
-            # Time decay
-            time_factor = self._calculate_time_decay(aid)
-            time_decays.append(time_factor)
-            
-            # Cluster similarity
-            cluster_sim = self._calculate_cluster_similarity(user_clusters, cluster)
-            cluster_similarities.append(cluster_sim)
-        
-        # Build recommendations with all similarity components
+        """Blend semantic scores with time decay and cluster affinity"""
+        user_clusters = [int(c) for c in self.article_clusters[read_idx] if c >= 0]
+
+        time_decays = self._calculate_time_decay()
+        cluster_similarities = self._calculate_cluster_similarity(user_clusters)
+
+        final_scores = (
+            scores * (1 - self.diversity_weight - self.cluster_weight) +
+            time_decays * self.diversity_weight +
+            cluster_similarities * self.cluster_weight
+        )
+        # Re-mask reads: the weighted sum could turn -inf into nan
+        final_scores[read_idx] = -np.inf
+
+        # Build output dicts only for the top N candidates; scores are
+        # rounded once as arrays and emitted as NumPy scalars
+        top_idx = _top_k_indices(final_scores, top_n)
+        final_r = np.round(final_scores[top_idx], 4)
+        semantic_r = np.round(scores[top_idx], 4)
+        freshness_r = np.round(time_decays[top_idx], 4)
+        topic_r = np.round(cluster_similarities[top_idx], 4)
+
         recommendations = []
-        for i, (aid, semantic_sim, time_decay, cluster_sim) in enumerate(zip(
-            candidate_ids, semantic_similarities, time_decays, cluster_similarities
-        )):
-            article_data = article_vectors[aid]
-            
-            # Calculate final score using weights
-            final_score = (
-                semantic_sim * (1 - self.diversity_weight - self.cluster_weight) +
-                time_decay * self.diversity_weight +
-                cluster_sim * self.cluster_weight
-            )
-            
+        for n, i in enumerate(top_idx):
+            metadata = self.article_meta[i]
             recommendations.append({
-                'article_id': aid,
-                'title': article_data['metadata'].get('title', ''),
-                'content': article_data['metadata'].get('content', ''),
-                'url': article_data['metadata'].get('url', ''),
-                'score': round(final_score, 4),
+                'article_id': self.article_ids[i],
+                'title': metadata.get('title', ''),
+                'content': self.article_content(self.article_ids[i]),
+                'url': metadata.get('url', ''),
+                'score': final_r[n],
                 'similarity_components': {
-                    'semantic': round(semantic_sim, 4),
-                    'freshness': round(time_decay, 4),
-                    'topic': round(cluster_sim, 4)
+                    'semantic': semantic_r[n],
+                    'freshness': freshness_r[n],
+                    'topic': topic_r[n]
                 }
             })
-        
-        # Sort by final score and return top N
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:top_n]
+
+        return recommendations
 
 
 class RecommenderFactory:
@@ -377,6 +593,7 @@ class RecommenderFactory:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Create a simple recommender
     simple_recommender = RecommenderFactory.create_recommender("simple")
     simple_recs = simple_recommender.recommend_for_user(
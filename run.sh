@@ -7,6 +7,11 @@ npm install
 npm run build
 cd ..
 
-# Start the Flask server
-echo "Starting Flask server..."
-python app.py 
\ No newline at end of file
+# Start the server
+if [ "$FLASK_ENV" = "development" ]; then
+    echo "Starting Flask development server..."
+    python app.py
+else
+    echo "Starting gunicorn..."
+    gunicorn -w "$(nproc)" -k gthread --threads 4 -b 0.0.0.0:5001 wsgi:app
+fi 
\ No newline at end of file
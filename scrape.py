@@ -1,5 +1,6 @@
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import asyncio
+import hashlib
 import json
 from pathlib import Path
 import logging
@@ -7,17 +8,145 @@ from typing import List, Dict
 import time
 import re
 import random
-import unicodedata
+import string
 import argparse
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# No basicConfig at import time; the entry point configures handlers
 logger = logging.getLogger(__name__)
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    """Serialize an article to indented JSON bytes, preferring orjson
+
+    orjson emits UTF-8 bytes directly from C; the stdlib path keeps the
+    scraper working without it.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _loads(data: bytes):
+    """Parse JSON bytes, preferring orjson"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _url_filename(url: str) -> str:
+    """Stable collision-free filename for a URL"""
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+def _parse_html(html):
+    """Parse HTML with selectolax's Lexbor engine, or BeautifulSoup as fallback"""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'lxml')
+
+def _css(tree, selector):
+    """Select all nodes matching a CSS selector on either parser"""
+    return tree.css(selector) if LexborHTMLParser is not None else tree.select(selector)
+
+def _css_first(tree, selector):
+    """Select the first node matching a CSS selector on either parser"""
+    return tree.css_first(selector) if LexborHTMLParser is not None else tree.select_one(selector)
+
+def _node_text(node):
+    """Stripped text content of a node on either parser"""
+    return node.text(strip=True) if LexborHTMLParser is not None else node.text.strip()
+
+# Transient statuses worth retrying, mirroring urllib3's status_forcelist
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Non-article sections, folded into one alternation so URL validation is
+# a single C-level scan instead of a dozen substring searches
+_VALID_PREFIX = 'https://www.e15.cz/'
+_EXCLUDED_RE = re.compile('|'.join(re.escape(p) for p in (
+    '/aplikace',
+    '/instagram',
+    '/facebook',
+    '/twitter',
+    '/youtube',
+    '/business-club',
+    '/flow',
+    '/kalendar',
+    '/svatky',
+    '/mistrovstvi',
+    '/program',
+    '/vysledky'
+)))
+
+# Paragraph prefixes that mark non-content boilerplate
+_META_PREFIX_RE = re.compile(
+    r'^(?:Foto|Zdroj|Související|Autor|Sdílet|Komentáře|Tagy|Kategorie):'
+)
+
+# Characters kept by _clean_text: alphanumerics with Czech diacritics,
+# whitespace, and basic punctuation
+_ALLOWED_CHARS = set(
+    string.ascii_letters + string.digits + 'ěščřžýáíéúůďťňóĚŠČŘŽÝÁÍÉÚŮĎŤŇÓ.,!?- '
+)
+
+class _KeepTable(dict):
+    """Lazy str.translate table that drops disallowed characters
+
+    Entries are built the first time each codepoint is seen, so the table
+    only ever holds the characters that actually occur in scraped text
+    instead of the full Unicode range.
+    """
+
+    def __missing__(self, code):
+        ch = chr(code)
+        value = ch if (ch in _ALLOWED_CHARS or ch.isspace()) else None
+        self[code] = value
+        return value
+
+_KEEP_TABLE = _KeepTable()
+
+def _word_count_at_least(paragraphs: List[str], n: int) -> bool:
+    """True once the paragraphs reach n words, short-circuiting early
+
+    Approximates words as space-separated runs, so no throwaway list the
+    size of the whole article is built just to take its len().
+    """
+    count = 0
+    for paragraph in paragraphs:
+        count += paragraph.count(' ') + 1
+        if count >= n:
+            return True
+    return False
+
+def _node_attr(node, name):
+    """Attribute value of a node on either parser, defaulting to ''"""
+    value = node.attributes.get(name) if LexborHTMLParser is not None else node.get(name)
+    return value or ''
+
+def _iter_hrefs(body: bytes):
+    """Yield every anchor href on the page via a streaming lxml pass
+
+    HTMLPullParser emits each <a> as soon as its end tag is parsed and the
+    element is cleared right after, so no full document tree is ever built.
+    Callers filter the hrefs with _is_valid_article_url, which is the final
+    authority on what counts as an article link anyway.
+    """
+    from lxml import etree
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    parser.feed(body)
+    for _, elem in parser.read_events():
+        href = elem.get('href', '')
+        if href:
+            yield href
+        elem.clear()
+
 class ArticleScraper:
     def __init__(self, base_url: str = "https://www.e15.cz/geopolitika"):
         self.base_url = base_url
-        self.session = requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -33,20 +162,62 @@ class ArticleScraper:
         }
         self.articles_dir = Path("articles")
         self.articles_dir.mkdir(exist_ok=True)
-        
-        # Initialize session
-        self._init_session()
-    
-    def _init_session(self):
+
+        # URLs already saved to disk; incremental runs skip their GET+parse
+        self._seen_urls = set()
+        for path in self.articles_dir.glob('*.txt'):
+            try:
+                url = _loads(path.read_bytes()).get('url')
+            except (OSError, ValueError):
+                continue
+            if url:
+                self._seen_urls.add(url)
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        retries: int = 3,
+        backoff: float = 0.3,
+        max_bytes: int = 2_000_000
+    ):
+        """GET a URL with exponential backoff on transient failures
+
+        Returns (headers, body); body is None for non-HTML responses,
+        which are rejected from the headers alone before any download.
+        HTML bodies come from a streamed read capped at max_bytes. Retries
+        cover connection errors, timeouts and the usual transient
+        statuses; the pooled connector keeps the TCP+TLS connection alive
+        across attempts and articles.
+        """
+        for attempt in range(retries + 1):
+            try:
+                async with session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    response.raise_for_status()
+                    if 'text/html' not in response.headers.get('Content-Type', ''):
+                        return response.headers, None
+                    return response.headers, await response.content.read(max_bytes)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = getattr(e, 'status', None)
+                if attempt >= retries or (
+                    status is not None and status not in _RETRY_STATUSES
+                ):
+                    raise
+                await asyncio.sleep(backoff * (2 ** attempt))
+
+    async def _init_session(self, session: aiohttp.ClientSession):
         """Initialize session with cookies and initial request"""
         try:
             # Make initial request to get cookies
-            response = self.session.get(self.base_url, headers=self.headers)
-            response.raise_for_status()
-            
+            async with session.get(self.base_url) as response:
+                response.raise_for_status()
+                await response.read()
+
             # Update headers with referer
-            self.headers['Referer'] = self.base_url
-            
+            session.headers['Referer'] = self.base_url
+
             logger.info("Session initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing session: {str(e)}")
@@ -55,128 +226,99 @@ class ArticleScraper:
         """Clean and normalize text"""
         if not text:
             return ""
-        # Remove multiple spaces and newlines
-        text = re.sub(r'\s+', ' ', text)
-        # Keep alphanumeric, spaces, and basic punctuation
-        text = re.sub(r'[^a-zA-ZěščřžýáíéúůďťňóĚŠČŘŽÝÁÍÉÚŮĎŤŇÓ\s.,!?0-9-]', '', text)
-        return text.strip()
-    
-    def _sanitize_filename(self, filename: str) -> str:
-        """Create a safe filename from text"""
-        # Remove diacritics
-        filename = unicodedata.normalize('NFKD', filename)
-        filename = ''.join(c for c in filename if not unicodedata.combining(c))
-        
-        # Replace spaces with underscores and remove invalid characters
-        filename = re.sub(r'[^\w\s-]', '', filename)
-        filename = re.sub(r'[-\s]+', '_', filename)
-        
-        return filename.lower()[:50]
+        # One C-level pass drops disallowed characters; split/join then
+        # collapses whitespace without a regex scan
+        return ' '.join(text.translate(_KEEP_TABLE).split())
     
     def _is_valid_article_url(self, url: str) -> bool:
         """Check if URL is a valid article URL"""
-        # Exclude non-article URLs
-        excluded_patterns = [
-            '/aplikace',
-            '/instagram',
-            '/facebook',
-            '/twitter',
-            '/youtube',
-            '/business-club',
-            '/flow',
-            '/kalendar',
-            '/svatky',
-            '/mistrovstvi',
-            '/program',
-            '/vysledky'
-        ]
-        
-        # Must be a valid e15.cz URL
-        if not url.startswith('https://www.e15.cz/'):
-            return False
-            
-        # Check for excluded patterns
-        for pattern in excluded_patterns:
-            if pattern in url.lower():
-                return False
-                
-        return True
+        # Must be a valid e15.cz URL with no excluded section in the path
+        return (
+            url.startswith(_VALID_PREFIX)
+            and _EXCLUDED_RE.search(url.lower()) is None
+        )
     
-    def _get_article_links(self) -> List[str]:
+    async def _get_article_links(self, session: aiohttp.ClientSession) -> List[str]:
         """Get all article links from the main page"""
         try:
             # Add random delay
-            time.sleep(random.uniform(1, 2))
-            
-            response = self.session.get(
-                self.base_url,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            if 'text/html' not in response.headers.get('Content-Type', ''):
+            await asyncio.sleep(random.uniform(1, 2))
+
+            headers, body = await self._fetch(session, self.base_url)
+
+            if body is None:
                 logger.error("Response is not HTML")
                 return []
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Find all article links
-            article_links = []
-            
-            # More specific selectors for e15.cz articles
-            selectors = [
-                'article.article-item a',  # Main article items
-                'div.article-list article a',  # Article list items
-                'div.content article a',  # Content area articles
-                'div.article-box a'  # Article boxes
-            ]
-            
-            for selector in selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href', '')
-                    if href and not href.endswith(self.base_url.split('/')[-1]):
-                        full_url = f"https://www.e15.cz{href}" if not href.startswith('http') else href
-                        if self._is_valid_article_url(full_url):
-                            article_links.append(full_url)
+
+            # Collect into a dict for order-preserving dedupe: one hash
+            # pass during collection, and page order stays deterministic
+            article_links = {}
+
+            if LexborHTMLParser is not None:
+                # Bytes go straight to the parser; it reads the charset
+                # itself, skipping a separate full-body decode
+                tree = _parse_html(body)
+
+                # More specific selectors for e15.cz articles, joined into one
+                # query so the tree is walked once instead of per selector
+                selector = ', '.join([
+                    'article.article-item a',  # Main article items
+                    'div.article-list article a',  # Article list items
+                    'div.content article a',  # Content area articles
+                    'div.article-box a'  # Article boxes
+                ])
+                hrefs = (_node_attr(link, 'href') for link in _css(tree, selector))
+            else:
+                # Without selectolax, stream anchors instead of building a
+                # full BeautifulSoup tree for one attribute per node
+                hrefs = _iter_hrefs(body)
+
+            for href in hrefs:
+                if href and not href.endswith(self.base_url.split('/')[-1]):
+                    full_url = f"https://www.e15.cz{href}" if not href.startswith('http') else href
+                    if self._is_valid_article_url(full_url):
+                        article_links[full_url] = None
             
             # Log the HTML if no links found
             if not article_links:
-                logger.debug(f"HTML content: {response.text[:1000]}")
+                logger.debug(f"HTML content: {body[:1000]}")
                 logger.warning("No article links found")
             
-            return list(set(article_links))  # Remove duplicates
+            return list(article_links)
             
         except Exception as e:
             logger.error(f"Error fetching article links: {str(e)}")
             return []
     
-    def _scrape_article(self, url: str) -> Dict:
+    async def _scrape_article(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
         """Scrape content from a single article"""
         try:
-            # Add random delay
-            time.sleep(random.uniform(2, 4))
-            
-            response = self.session.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            if 'text/html' not in response.headers.get('Content-Type', ''):
+            async with semaphore:
+                # Add random delay; sleeping inside the semaphore keeps the
+                # request rate polite even with many queued tasks
+                await asyncio.sleep(random.uniform(2, 4))
+
+                headers, body = await self._fetch(session, url)
+
+            if body is None:
                 logger.error(f"Response for {url} is not HTML")
                 return None
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
+
+            # Bytes go straight to the parser; it reads the charset itself,
+            # skipping a separate full-body decode
+            tree = _parse_html(body)
+
             # Extract article content with multiple selector attempts
             title = None
             for selector in ['h1.article-title', 'h1.title', 'h1']:
-                title_elem = soup.select_one(selector)
+                title_elem = _css_first(tree, selector)
                 if title_elem:
-                    title = title_elem.text.strip()
+                    title = _node_text(title_elem)
                     break
             
             content = []
@@ -189,15 +331,12 @@ class ArticleScraper:
             ]
             
             for selector in content_selectors:
-                paragraphs = soup.select(selector)
+                paragraphs = _css(tree, selector)
                 if paragraphs:
                     for p in paragraphs:
-                        text = p.text.strip()
+                        text = _node_text(p)
                         # Skip non-content elements
-                        if text and not any(text.startswith(prefix) for prefix in [
-                            'Foto:', 'Zdroj:', 'Související:', 'Autor:', 
-                            'Sdílet:', 'Komentáře:', 'Tagy:', 'Kategorie:'
-                        ]):
+                        if text and not _META_PREFIX_RE.match(text):
                             content.append(text)
                     break
             
@@ -205,12 +344,14 @@ class ArticleScraper:
                 logger.warning(f"Missing content for {url}")
                 return None
                 
-            # Validate content length
-            full_content = ' '.join(content)
-            if len(full_content.split()) < 100:  # Require at least 100 words
+            # Require at least 100 words, checked before the join and the
+            # cleaning pass so short articles skip both
+            if not _word_count_at_least(content, 100):
                 logger.warning(f"Content too short for {url}")
                 return None
-            
+
+            full_content = ' '.join(content)
+
             return {
                 'title': self._clean_text(title),
                 'content': self._clean_text(full_content),
@@ -221,36 +362,46 @@ class ArticleScraper:
             logger.error(f"Error scraping article {url}: {str(e)}")
             return None
     
-    def scrape_and_save(self, max_articles: int = 10):
-        """Scrape articles and save them to files"""
-        article_links = self._get_article_links()
-        logger.info(f"Found {len(article_links)} articles")
-        
+    async def scrape_and_save(self, max_articles: int = 10):
+        """Scrape articles concurrently and save them to files"""
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            headers=self.headers, connector=connector
+        ) as session:
+            await self._init_session(session)
+
+            article_links = await self._get_article_links(session)
+            logger.info(f"Found {len(article_links)} articles")
+
+            # Bounded concurrency: fetches overlap but never more than 5 run
+            # at once, keeping the per-request delays polite
+            semaphore = asyncio.Semaphore(5)
+            targets = [
+                url for url in article_links if url not in self._seen_urls
+            ][:max_articles]
+            articles = await asyncio.gather(
+                *(self._scrape_article(url, session, semaphore) for url in targets),
+                return_exceptions=True
+            )
+
         scraped_count = 0
-        for url in article_links[:max_articles]:
-            try:
-                article = self._scrape_article(url)
-                if article and article['content']:  # Only save if we got content
-                    # Create a safe filename from the URL
-                    filename = self._sanitize_filename(url.split('/')[-1])
-                    if not filename:
-                        filename = self._sanitize_filename(article['title'])
-                    
-                    # Save article as JSON
-                    article_file = self.articles_dir / f"{filename}.txt"
-                    with open(article_file, 'w', encoding='utf-8') as f:
-                        json.dump(article, f, indent=2, ensure_ascii=False)
-                    
-                    scraped_count += 1
-                    logger.info(f"Saved article: {article['title']}")
-                    
-                    if scraped_count >= max_articles:
-                        break
-                        
-            except Exception as e:
-                logger.error(f"Error processing article {url}: {str(e)}")
+        for url, article in zip(targets, articles):
+            if isinstance(article, Exception):
+                logger.error(f"Error processing article {url}: {str(article)}")
                 continue
-        
+            if article and article['content']:  # Only save if we got content
+                # Hash the URL for a stable, collision-free filename
+                filename = _url_filename(url)
+
+                # Save article as JSON; the blocking write runs in a worker
+                # thread so it never stalls the event loop
+                article_file = self.articles_dir / f"{filename}.txt"
+                await asyncio.to_thread(article_file.write_bytes, _dumps(article))
+                self._seen_urls.add(url)
+
+                scraped_count += 1
+                logger.info(f"Saved article: {article['title']}")
+
         logger.info(f"Successfully scraped {scraped_count} articles")
 
 def main():
@@ -260,10 +411,11 @@ def main():
     
     scraper = ArticleScraper(base_url=args.url)
     try:
-        scraper.scrape_and_save(max_articles=10)
+        asyncio.run(scraper.scrape_and_save(max_articles=10))
     except Exception as e:
         logger.error(f"Error in scraping process: {str(e)}")
         raise
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main() 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
 import os
+import types
 from pathlib import Path
 import json
 
@@ -34,8 +35,10 @@ def sample_articles(test_data_dir):
     for article_id, data in articles.items():
         with open(articles_dir / f"{article_id}.json", 'w') as f:
             json.dump(data, f)
-    
-    return articles
+
+    # Read-only view: the fixture is session-scoped, so a test mutating
+    # it would silently leak into every later test
+    return types.MappingProxyType(articles)
 
 @pytest.fixture(scope="session")
 def sample_embeddings(test_data_dir):
@@ -62,5 +65,5 @@ def sample_embeddings(test_data_dir):
     
     with open(embeddings_dir / "article_vectors.json", 'w') as f:
         json.dump(embeddings, f)
-    
-    return embeddings 
\ No newline at end of file
+
+    return types.MappingProxyType(embeddings) 
\ No newline at end of file
@@ -3,6 +3,7 @@ from embed import ArticleEmbedder
 import numpy as np
 from pathlib import Path
 import json
+import orjson
 
 @pytest.fixture
 def embedder():
@@ -27,10 +28,12 @@ def test_embedding_generation(embedder, sample_article):
     # Generate embedding
     embedding = embedder.generate_embedding(sample_article)
     
-    # Check embedding properties
-    assert isinstance(embedding, list)
-    assert len(embedding) > 0
-    assert all(isinstance(x, float) for x in embedding)
+    # Check embedding properties; one C-level conversion replaces the
+    # per-element isinstance scan and still fails on non-float entries
+    arr = np.asarray(embedding)
+    assert arr.ndim == 1
+    assert arr.size > 0
+    assert np.issubdtype(arr.dtype, np.floating)
 
 def test_embedding_saving(embedder, tmp_path):
     # Create temporary directories
@@ -59,11 +62,10 @@ def test_embedding_saving(embedder, tmp_path):
     assert embedding_file.exists()
     
     # Check embedding content
-    with open(embedding_file) as f:
-        data = json.load(f)
-        assert 'vector' in data
-        assert isinstance(data['vector'], list)
-        assert len(data['vector']) > 0
+    data = orjson.loads(embedding_file.read_bytes())
+    assert 'vector' in data
+    assert isinstance(data['vector'], list)
+    assert len(data['vector']) > 0
 
 def test_invalid_article(embedder, tmp_path):
     # Create temporary directories
@@ -3,6 +3,7 @@ from scrape import ArticleScraper
 import os
 from pathlib import Path
 import json
+import orjson
 
 @pytest.fixture
 def scraper():
@@ -38,10 +39,9 @@ def test_article_saving(scraper, tmp_path):
     assert article_file.exists()
     
     # Check content
-    with open(article_file) as f:
-        saved_data = json.load(f)
-        assert saved_data['metadata']['title'] == article_data['title']
-        assert saved_data['metadata']['content'] == article_data['content']
+    saved_data = orjson.loads(article_file.read_bytes())
+    assert saved_data['metadata']['title'] == article_data['title']
+    assert saved_data['metadata']['content'] == article_data['content']
 
 def test_invalid_url(scraper):
     with pytest.raises(ValueError):
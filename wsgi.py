@@ -0,0 +1,10 @@
+"""
+WSGI entrypoint for running the app under a production server.
+
+Usage:
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:5001 wsgi:app
+"""
+from app import app
+
+if __name__ == "__main__":
+    app.run()